@@ -3,11 +3,12 @@ GUI package for BetterMint Modded
 """
 
 from .main_window import ChessEngineGUI
-from .engine_store import EngineStoreDialog, EngineManager, EngineManifest
+from .engine_store import EngineStoreDialog, EngineManager, EngineManifest, get_engine_manager
 
 __all__ = [
     'ChessEngineGUI',
     'EngineStoreDialog',
     'EngineManager',
-    'EngineManifest'
+    'EngineManifest',
+    'get_engine_manager'
 ]
\ No newline at end of file
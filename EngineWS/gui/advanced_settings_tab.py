@@ -4,14 +4,54 @@ Configuration for performance monitoring, notifications, and debug features
 """
 
 import os
-import glob
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox, 
     QGroupBox, QGridLayout, QComboBox, QPushButton, QMessageBox
 )
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, QObject, QRunnable, QThreadPool
 
 from settings import SettingsManager
+from .settings_helpers import signals_blocked
+
+
+_CACHE_SUFFIXES = (".cache", ".tmp")
+
+_NOTIF_STORE_TO_DISPLAY = {"minimal": "Minimal", "normal": "Normal", "verbose": "Verbose"}
+_NOTIF_DISPLAY_TO_STORE = {v: k for k, v in _NOTIF_STORE_TO_DISPLAY.items()}
+
+
+class _ClearCacheSignals(QObject):
+    """Signals for the cache clearing worker"""
+
+    done = Signal(int, str)  # removed count, error message
+
+
+class _ClearCacheWorker(QRunnable):
+    """Removes cache files off the GUI thread"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _ClearCacheSignals()
+
+    def run(self):
+        removed_count = 0
+        try:
+            # Single directory read, filtering by literal suffix
+            with os.scandir(".") as it:
+                cache_files = [
+                    entry for entry in it
+                    if entry.name.endswith(_CACHE_SUFFIXES) and entry.is_file()
+                ]
+            for entry in cache_files:
+                try:
+                    os.unlink(entry.path)
+                    removed_count += 1
+                except Exception as e:
+                    print(f"Failed to remove cache file {entry.name}: {e}")
+        except Exception as e:
+            self.signals.done.emit(removed_count, str(e))
+            return
+        self.signals.done.emit(removed_count, "")
 
 
 class AdvancedSettingsTab(QWidget):
@@ -22,10 +62,30 @@ class AdvancedSettingsTab(QWidget):
     def __init__(self, settings_manager: SettingsManager, parent=None):
         super().__init__(parent)
         self.settings_manager = settings_manager
-        self.setup_ui()
+        # Last monitoring state announced through performance_monitoring_changed;
+        # the main window applies the stored state itself at startup
+        self._monitoring = bool(settings_manager.get_setting("performance-monitoring"))
+        # The widget tree is built on first show; see showEvent
+        self._ui_built = False
+    
+    def showEvent(self, event):
+        """Build the tab UI the first time it becomes visible"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+        super().showEvent(event)
     
     def setup_ui(self):
         """Setup the Advanced Settings tab UI"""
+        # Build the whole tree before the first layout pass
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _build_ui(self):
+        """Create the advanced settings widgets"""
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
 
@@ -43,7 +103,7 @@ class AdvancedSettingsTab(QWidget):
         # Auto-save settings
         self.autosave_checkbox = QCheckBox("Auto-Save Settings")
         self.autosave_checkbox.setChecked(self.settings_manager.get_setting("auto-save-settings"))
-        self.autosave_checkbox.toggled.connect(lambda x: self.settings_manager.set_setting("auto-save-settings", x))
+        self.autosave_checkbox.toggled.connect(self.on_autosave_changed)
         perf_layout.addWidget(self.autosave_checkbox)
 
         layout.addWidget(perf_group)
@@ -55,10 +115,10 @@ class AdvancedSettingsTab(QWidget):
 
         notif_layout.addWidget(QLabel("Notification Level:"), 0, 0)
         self.notif_combo = QComboBox()
-        self.notif_combo.addItems(["Minimal", "Normal", "Verbose"])
+        self.notif_combo.addItems(list(_NOTIF_DISPLAY_TO_STORE))
         current_level = self.settings_manager.get_setting("notification-level", "normal")
-        self.notif_combo.setCurrentText(current_level.title())
-        self.notif_combo.currentTextChanged.connect(lambda x: self.settings_manager.set_setting("notification-level", x.lower()))
+        self.notif_combo.setCurrentText(_NOTIF_STORE_TO_DISPLAY.get(current_level, "Normal"))
+        self.notif_combo.currentTextChanged.connect(self.on_notification_level_changed)
         notif_layout.addWidget(self.notif_combo, 0, 1)
 
         layout.addWidget(notif_group)
@@ -88,29 +148,45 @@ class AdvancedSettingsTab(QWidget):
         """Handle performance monitoring toggle with signal emission"""
         try:
             self.settings_manager.set_setting("performance-monitoring", checked)
+            self._monitoring = checked
             self.performance_monitoring_changed.emit(checked)
         except Exception as e:
             print(f"Error toggling performance monitoring: {e}")
     
+    def _sync_monitoring(self, enabled):
+        """Announce the monitoring state if it differs from the last one applied"""
+        enabled = bool(enabled)
+        if enabled != self._monitoring:
+            self._monitoring = enabled
+            self.performance_monitoring_changed.emit(enabled)
+    
+    def on_autosave_changed(self, checked):
+        """Persist the auto-save toggle"""
+        self.settings_manager.set_setting("auto-save-settings", checked)
+    
+    def on_notification_level_changed(self, text):
+        """Persist the selected notification level"""
+        self.settings_manager.set_setting("notification-level", _NOTIF_DISPLAY_TO_STORE[text])
+    
     def clear_cache(self):
-        """Clear cache files with error handling"""
-        try:
-            cache_files = glob.glob("*.cache") + glob.glob("*.tmp")
-            removed_count = 0
-            for file in cache_files:
-                try:
-                    os.remove(file)
-                    removed_count += 1
-                except Exception as e:
-                    print(f"Failed to remove cache file {file}: {e}")
-            
+        """Clear cache files on the thread pool and report when done"""
+        worker = _ClearCacheWorker()
+        worker.signals.done.connect(self.on_cache_cleared)
+        # Keep the signal holder alive until the worker reports back
+        self._clear_cache_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def on_cache_cleared(self, removed_count, error):
+        """Show the result of a cache clear"""
+        self._clear_cache_worker = None
+        if error:
+            QMessageBox.warning(self, "Error", f"Failed to clear cache: {error}")
+        else:
             QMessageBox.information(
                 self, 
                 "Success", 
                 f"Cache cleared successfully! Removed {removed_count} files."
             )
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to clear cache: {str(e)}")
     
     def reset_to_defaults(self):
         """Reset settings to defaults with confirmation"""
@@ -125,19 +201,41 @@ class AdvancedSettingsTab(QWidget):
             )
             
             if reply == QMessageBox.Yes:
-                self.settings_manager.reset_to_defaults()
-                # Reload the current tab's UI to reflect changes
-                self.load_settings()
+                # Apply the returned defaults directly instead of re-reading them
+                self.apply_settings(self.settings_manager.reset_to_defaults())
                 QMessageBox.information(self, "Success", "Settings reset to defaults!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to reset settings: {str(e)}")
     
     def load_settings(self):
         """Reload settings from settings manager with error handling"""
+        if not self._ui_built:
+            # setup_ui reads the widget values when the tab is first shown, but
+            # the main window must still follow a reloaded monitoring flag
+            try:
+                self._sync_monitoring(self.settings_manager.get_setting("performance-monitoring"))
+            except Exception as e:
+                print(f"Error loading advanced settings: {e}")
+            return
         try:
-            self.perf_monitor_checkbox.setChecked(self.settings_manager.get_setting("performance-monitoring"))
-            self.autosave_checkbox.setChecked(self.settings_manager.get_setting("auto-save-settings"))
-            notif_level = self.settings_manager.get_setting("notification-level", "normal")
-            self.notif_combo.setCurrentText(notif_level.title())
+            self.apply_settings(self.settings_manager.get_many([
+                "performance-monitoring",
+                "auto-save-settings",
+                "notification-level",
+            ]))
+        except Exception as e:
+            print(f"Error loading advanced settings: {e}")
+    
+    def apply_settings(self, vals):
+        """Push already-fetched setting values into the widgets"""
+        if not self._ui_built:
+            return
+        try:
+            with signals_blocked(self.perf_monitor_checkbox, self.autosave_checkbox, self.notif_combo):
+                self.perf_monitor_checkbox.setChecked(vals["performance-monitoring"])
+                self.autosave_checkbox.setChecked(vals["auto-save-settings"])
+                self.notif_combo.setCurrentText(_NOTIF_STORE_TO_DISPLAY.get(vals["notification-level"], "Normal"))
+
+            self._sync_monitoring(self.perf_monitor_checkbox.isChecked())
         except Exception as e:
-            print(f"Error loading advanced settings: {e}")
\ No newline at end of file
+            print(f"Error applying advanced settings: {e}")
\ No newline at end of file
@@ -10,9 +10,10 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Signal
 
 from settings import SettingsManager
+from .settings_helpers import DebouncedSettingsMixin, signals_blocked
 
 
-class AutoMoveSettingsTab(QWidget):
+class AutoMoveSettingsTab(DebouncedSettingsMixin, QWidget):
     """Tab for auto-move configuration with intelligent timing"""
     
     settings_changed = Signal()
@@ -20,10 +21,34 @@ class AutoMoveSettingsTab(QWidget):
     def __init__(self, settings_manager: SettingsManager, parent=None):
         super().__init__(parent)
         self.settings_manager = settings_manager
-        self.setup_ui()
+
+        # Spin box edits are coalesced so a held arrow key writes once
+        self._init_debounce("auto-move")
+
+        # The widget tree is built on first show; see showEvent
+        self._ui_built = False
+    
+    def showEvent(self, event):
+        """Build the tab UI the first time it becomes visible"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+        super().showEvent(event)
     
     def setup_ui(self):
         """Setup the Auto-Move Settings tab UI"""
+        # Maps each spin box to the setting key it edits
+        self._spin_bindings = {}
+
+        # Build the whole tree before the first layout pass
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _build_ui(self):
+        """Create the auto-move widgets"""
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
 
@@ -38,31 +63,15 @@ class AutoMoveSettingsTab(QWidget):
         self.automove_checkbox.toggled.connect(self.on_automove_toggled)
         automove_layout.addWidget(self.automove_checkbox, 0, 0, 1, 2)
 
-        # Base delay
-        automove_layout.addWidget(QLabel("Base Delay (ms):"), 1, 0)
-        self.automove_delay_spin = QSpinBox()
-        self.automove_delay_spin.setRange(0, 30000)
-        self.automove_delay_spin.setSingleStep(100)
-        self.automove_delay_spin.setValue(self.settings_manager.get_setting("auto-move-time"))
-        self.automove_delay_spin.valueChanged.connect(lambda x: self.settings_manager.set_setting("auto-move-time", x))
-        automove_layout.addWidget(self.automove_delay_spin, 1, 1)
-
-        # Random delay
-        automove_layout.addWidget(QLabel("Random Delay (ms):"), 2, 0)
-        self.automove_random_spin = QSpinBox()
-        self.automove_random_spin.setRange(0, 10000)
-        self.automove_random_spin.setSingleStep(100)
-        self.automove_random_spin.setValue(self.settings_manager.get_setting("auto-move-time-random"))
-        self.automove_random_spin.valueChanged.connect(lambda x: self.settings_manager.set_setting("auto-move-time-random", x))
-        automove_layout.addWidget(self.automove_random_spin, 2, 1)
-
-        # Best move chance
-        automove_layout.addWidget(QLabel("Best Move Chance (%):"), 3, 0)
-        self.best_move_spin = QSpinBox()
-        self.best_move_spin.setRange(0, 100)
-        self.best_move_spin.setValue(self.settings_manager.get_setting("best-move-chance"))
-        self.best_move_spin.valueChanged.connect(lambda x: self.settings_manager.set_setting("best-move-chance", x))
-        automove_layout.addWidget(self.best_move_spin, 3, 1)
+        self.automove_delay_spin = self._spin(
+            automove_layout, 1, "Base Delay (ms):", "auto-move-time", 0, 30000, 100
+        )
+        self.automove_random_spin = self._spin(
+            automove_layout, 2, "Random Delay (ms):", "auto-move-time-random", 0, 10000, 100
+        )
+        self.best_move_spin = self._spin(
+            automove_layout, 3, "Best Move Chance (%):", "best-move-chance", 0, 100
+        )
 
         # Random best move
         #self.random_best_checkbox = QCheckBox("Random Best Move Selection")
@@ -77,25 +86,28 @@ class AutoMoveSettingsTab(QWidget):
         timing_group.setObjectName("settings_group")
         timing_layout = QGridLayout(timing_group)
 
-        # Randomization divider
-        timing_layout.addWidget(QLabel("Random Divider:"), 0, 0)
-        self.random_div_spin = QSpinBox()
-        self.random_div_spin.setRange(1, 500)
-        self.random_div_spin.setValue(self.settings_manager.get_setting("auto-move-time-random-div"))
-        self.random_div_spin.valueChanged.connect(lambda x: self.settings_manager.set_setting("auto-move-time-random-div", x))
-        timing_layout.addWidget(self.random_div_spin, 0, 1)
-
-        # Randomization multiplier
-        timing_layout.addWidget(QLabel("Random Multiplier:"), 1, 0)
-        self.random_multi_spin = QSpinBox()
-        self.random_multi_spin.setRange(1, 2000)
-        self.random_multi_spin.setValue(self.settings_manager.get_setting("auto-move-time-random-multi"))
-        self.random_multi_spin.valueChanged.connect(lambda x: self.settings_manager.set_setting("auto-move-time-random-multi", x))
-        timing_layout.addWidget(self.random_multi_spin, 1, 1)
+        self.random_div_spin = self._spin(
+            timing_layout, 0, "Random Divider:", "auto-move-time-random-div", 1, 500
+        )
+        self.random_multi_spin = self._spin(
+            timing_layout, 1, "Random Multiplier:", "auto-move-time-random-multi", 1, 2000
+        )
 
         layout.addWidget(timing_group)
         layout.addStretch()
     
+    def _spin(self, grid, row, label, key, lo, hi, step=1):
+        """Add a labelled spin box bound to a setting key to a grid row"""
+        spin = QSpinBox()
+        spin.setRange(lo, hi)
+        spin.setSingleStep(step)
+        spin.setValue(self.settings_manager.get_setting(key))
+        self._spin_bindings[spin] = key
+        spin.valueChanged.connect(self._on_spin_changed)
+        grid.addWidget(QLabel(label), row, 0)
+        grid.addWidget(spin, row, 1)
+        return spin
+    
     def on_automove_toggled(self, checked):
         """Handle auto-move toggle with signal emission"""
         try:
@@ -106,13 +118,35 @@ class AutoMoveSettingsTab(QWidget):
     
     def load_settings(self):
         """Reload settings from settings manager with error handling"""
+        if not self._ui_built:
+            # setup_ui reads the current values when the tab is first shown
+            return
         try:
-            self.automove_checkbox.setChecked(self.settings_manager.get_setting("legit-auto-move"))
-            self.automove_delay_spin.setValue(self.settings_manager.get_setting("auto-move-time"))
-            self.automove_random_spin.setValue(self.settings_manager.get_setting("auto-move-time-random"))
-            self.best_move_spin.setValue(self.settings_manager.get_setting("best-move-chance"))
-            self.random_best_checkbox.setChecked(self.settings_manager.get_setting("random-best-move"))
-            self.random_div_spin.setValue(self.settings_manager.get_setting("auto-move-time-random-div"))
-            self.random_multi_spin.setValue(self.settings_manager.get_setting("auto-move-time-random-multi"))
+            vals = self.settings_manager.get_many([
+                "legit-auto-move",
+                "auto-move-time",
+                "auto-move-time-random",
+                "best-move-chance",
+                "auto-move-time-random-div",
+                "auto-move-time-random-multi",
+            ])
+
+            self.discard_pending()
+
+            was_enabled = self.automove_checkbox.isChecked()
+
+            with signals_blocked(
+                self.automove_checkbox, self.automove_delay_spin, self.automove_random_spin,
+                self.best_move_spin, self.random_div_spin, self.random_multi_spin
+            ):
+                self.automove_checkbox.setChecked(vals["legit-auto-move"])
+                self.automove_delay_spin.setValue(vals["auto-move-time"])
+                self.automove_random_spin.setValue(vals["auto-move-time-random"])
+                self.best_move_spin.setValue(vals["best-move-chance"])
+                self.random_div_spin.setValue(vals["auto-move-time-random-div"])
+                self.random_multi_spin.setValue(vals["auto-move-time-random-multi"])
+
+            if self.automove_checkbox.isChecked() != was_enabled:
+                self.settings_changed.emit()
         except Exception as e:
             print(f"Error loading auto-move settings: {e}")
\ No newline at end of file
@@ -3,18 +3,187 @@ Extension Installation Guide for BetterMint Modded GUI
 Clean, modern implementation with improved visual design
 """
 
-import os
-import sys
-import subprocess
+import html
+from collections import namedtuple
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QFrame, QScrollArea, QSpacerItem, QSizePolicy
+    QWidget, QVBoxLayout, QGridLayout, QLabel, QPushButton, 
+    QFrame, QScrollArea, QMessageBox
+)
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QRectF, QUrl
+from PySide6.QtGui import (
+    QColor, QDesktopServices, QFont, QLinearGradient, QPainter, QPalette, QPixmap, QPixmapCache
+)
+
+
+# Unpacked browser extension shipped next to EngineWS
+_EXTENSION_DIR = Path(__file__).resolve().parent.parent.parent / "BetterMintModded"
+
+
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False) -> QFont:
+    """Shared guide font; built on first use since QFont needs a QGuiApplication"""
+    return QFont("Segoe UI", point_size, QFont.Bold if bold else QFont.Normal)
+
+
+def _number_badge(text: str, diameter: int, point_size: int,
+                  top_color: str, bottom_color: str, dpr: float) -> QPixmap:
+    """Render a numbered circle once and share it through QPixmapCache"""
+    key = f"bm_guide_badge:{text}:{diameter}:{point_size}:{top_color}:{bottom_color}:{dpr}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+
+    side = round(diameter * dpr)
+    pixmap = QPixmap(side, side)
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+
+    gradient = QLinearGradient(0, 0, diameter, diameter)
+    gradient.setColorAt(0, QColor(top_color))
+    gradient.setColorAt(1, QColor(bottom_color))
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(gradient)
+    painter.drawEllipse(QRectF(0, 0, diameter, diameter))
+    painter.setPen(QColor("white"))
+    painter.setFont(_font(point_size, True))
+    painter.drawText(QRectF(0, 0, diameter, diameter), Qt.AlignCenter, text)
+    painter.end()
+
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _card(parent_layout, object_name: str, layout_cls=QVBoxLayout, spacing=None):
+    """Append a styled section frame to parent_layout and return it with its layout"""
+    frame = QFrame()
+    frame.setObjectName(object_name)
+    frame_layout = layout_cls(frame)
+    if spacing is not None:
+        frame_layout.setSpacing(spacing)
+    parent_layout.addWidget(frame)
+    return frame, frame_layout
+
+
+# Extension guide stylesheet, installed once on the guide and keyed by object name
+_GUIDE_QSS = """
+QScrollBar:vertical {
+    background-color: #2a2a2a;
+    width: 12px;
+    border-radius: 6px;
+}
+QScrollBar::handle:vertical {
+    background-color: #69923e;
+    border-radius: 6px;
+    min-height: 20px;
+}
+QScrollBar::handle:vertical:hover {
+    background-color: #7aa84a;
+}
+QFrame#header_frame {
+    background: qlineargradient(
+        x1:0, y1:0, x2:0, y2:1,
+        stop:0 #3a5028,
+        stop:1 #69923e
+    );
+    border: none;
+    border-radius: 12px;
+    padding: 40px;
+}
+QFrame#section_frame {
+    background-color: #252525;
+    border: 1px solid #3a3a3a;
+    border-radius: 12px;
+    padding: 30px;
+}
+QPushButton#step_button {
+    background: qlineargradient(
+        x1:0, y1:0, x2:0, y2:1,
+        stop:0 #69923e,
+        stop:1 #4e7837
+    );
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 12px 24px;
+    min-height: 20px;
+}
+QPushButton#step_button:hover {
+    background: qlineargradient(
+        x1:0, y1:0, x2:0, y2:1,
+        stop:0 #7aa84a,
+        stop:1 #69923e
+    );
+}
+QPushButton#step_button:pressed {
+    background-color: #3e5f2b;
+}
+QFrame#footer_frame {
+    background-color: #1f1f1f;
+    border: 1px solid #3a3a3a;
+    border-radius: 12px;
+    padding: 25px;
+    margin-top: 10px;
+}
+"""
+
+
+# Row of the quick start list; Qt rich text has no border-radius, so the badge is a filled cell
+_USAGE_ROW = (
+    "<tr>"
+    "<td width='24' align='center' valign='middle' bgcolor='#69923e'>"
+    "<b style='color: white;'>{number}</b></td>"
+    "<td style='color: #e0e0e0; padding-left: 12px;'>{text}</td>"
+    "</tr>"
+)
+
+
+_GuideStep = namedtuple("_GuideStep", "number title description button_text action_name")
+
+# Installation steps; action_name is resolved on the guide widget
+_INSTALL_STEPS = (
+    _GuideStep(
+        "1",
+        "Locate Extension Files",
+        "Open the folder containing the BetterMint Modded extension files. This folder includes all necessary components for installation.",
+        "Open Extension Folder",
+        "open_extension_folder",
+    ),
+    _GuideStep(
+        "2",
+        "Access Chrome Extensions",
+        "Open Google Chrome and navigate to chrome://extensions/ in the address bar, or use Menu > More Tools > Extensions.",
+        None,
+        None,
+    ),
+    _GuideStep(
+        "3",
+        "Enable Developer Mode",
+        "Toggle the 'Developer mode' switch located in the top-right corner of the extensions page to enable manual installation.",
+        None,
+        None,
+    ),
+    _GuideStep(
+        "4",
+        "Install Extension",
+        "Click the 'Load unpacked' button and select the BetterMintModded folder from step 1 to install the extension.",
+        None,
+        None,
+    ),
+    _GuideStep(
+        "5",
+        "Start Analyzing",
+        "Visit your preferred chess platform and begin a game. The extension will automatically connect to the server and start providing analysis.",
+        None,
+        None,
+    ),
 )
-from PySide6.QtCore import Qt, Signal, QObject
-from PySide6.QtGui import QFont, QPixmap
 
 
 class PlaywrightChessController(QObject):
@@ -58,10 +227,20 @@ class ExtensionGuideWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setup_ui()
+        # The guide is built on first show; see showEvent
+        self._ui_built = False
+    
+    def showEvent(self, event):
+        """Build the guide the first time it becomes visible"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+        super().showEvent(event)
     
     def setup_ui(self):
         """Setup the extension guide UI"""
+        self.setStyleSheet(_GUIDE_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -71,28 +250,16 @@ class ExtensionGuideWidget(QWidget):
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #1a1a1a;
-            }
-            QScrollBar:vertical {
-                background-color: #2a2a2a;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #69923e;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #7aa84a;
-            }
-        """)
+        scroll_area.setFrameShape(QFrame.NoFrame)
+        # The content widget fills the background; skip a second fill on the viewport
+        scroll_area.viewport().setAutoFillBackground(False)
         
         # Main content widget
         content_widget = QWidget()
+        palette = content_widget.palette()
+        palette.setColor(QPalette.Window, QColor("#1a1a1a"))
+        content_widget.setPalette(palette)
+        content_widget.setAutoFillBackground(True)
         content_layout = QVBoxLayout(content_widget)
         content_layout.setContentsMargins(50, 40, 50, 40)
         content_layout.setSpacing(30)
@@ -119,18 +286,7 @@ class ExtensionGuideWidget(QWidget):
     def create_header_section(self, layout):
         """Create the header section"""
         header_frame = QFrame()
-        header_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3a5028,
-                    stop:1 #69923e
-                );
-                border: none;
-                border-radius: 12px;
-                padding: 40px;
-            }
-        """)
+        header_frame.setObjectName("header_frame")
         
         header_layout = QVBoxLayout(header_frame)
         header_layout.setSpacing(20)
@@ -138,198 +294,73 @@ class ExtensionGuideWidget(QWidget):
     
     def create_installation_steps(self, layout):
         """Create installation steps section"""
-        steps_frame = QFrame()
-        steps_frame.setStyleSheet("""
-            QFrame {
-                background-color: #252525;
-                border: 1px solid #3a3a3a;
-                border-radius: 12px;
-                padding: 30px;
-            }
-        """)
-        
-        steps_layout = QVBoxLayout(steps_frame)
-        steps_layout.setSpacing(20)
+        # One grid for the whole section: number | title + description | button
+        steps_frame, steps_layout = _card(layout, "section_frame", QGridLayout)
+        steps_layout.setHorizontalSpacing(20)
+        steps_layout.setVerticalSpacing(8)
+        steps_layout.setColumnStretch(1, 1)
         
         # Section title
         steps_title = QLabel("Installation Guide")
-        steps_title.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        steps_title.setFont(_font(18, True))
         steps_title.setStyleSheet("color: #69923e; background: transparent; margin-bottom: 5px;")
-        steps_layout.addWidget(steps_title)
+        steps_layout.addWidget(steps_title, 0, 0, 1, 3)
         
         # Subtitle
         steps_subtitle = QLabel("Follow these steps to get started")
-        steps_subtitle.setFont(QFont("Segoe UI", 10))
+        steps_subtitle.setFont(_font(10))
         steps_subtitle.setStyleSheet("color: #b0b0b0; background: transparent; margin-bottom: 15px;")
-        steps_layout.addWidget(steps_subtitle)
-        
-        # Installation steps
-        steps = [
-            {
-                "number": "1",
-                "title": "Locate Extension Files",
-                "description": "Open the folder containing the BetterMint Modded extension files. This folder includes all necessary components for installation.",
-                "button_text": "Open Extension Folder",
-                "action": self.open_extension_folder,
-                "icon": "folder"
-            },
-            {
-                "number": "2", 
-                "title": "Access Chrome Extensions",
-                "description": "Open Google Chrome and navigate to chrome://extensions/ in the address bar, or use Menu > More Tools > Extensions.",
-                "button_text": None,
-                "action": None,
-                "icon": "browser"
-            },
-            {
-                "number": "3",
-                "title": "Enable Developer Mode", 
-                "description": "Toggle the 'Developer mode' switch located in the top-right corner of the extensions page to enable manual installation.",
-                "button_text": None,
-                "action": None,
-                "icon": "settings"
-            },
-            {
-                "number": "4",
-                "title": "Install Extension",
-                "description": "Click the 'Load unpacked' button and select the BetterMint ModdedModded folder from step 1 to install the extension.",
-                "button_text": None,
-                "action": None,
-                "icon": "upload"
-            },
-            {
-                "number": "5",
-                "title": "Start Analyzing",
-                "description": "Visit your preferred chess platform and begin a game. The extension will automatically connect to the server and start providing analysis.",
-                "button_text": None,
-                "action": None,
-                "icon": "play"
-            }
-        ]
+        steps_layout.addWidget(steps_subtitle, 1, 0, 1, 3)
         
-        for step in steps:
-            step_widget = self.create_step_widget(step)
-            steps_layout.addWidget(step_widget)
-        
-        layout.addWidget(steps_frame)
+        row = 2
+        for step in _INSTALL_STEPS:
+            self.add_step_row(steps_layout, row, step)
+            row += 2
     
-    def create_step_widget(self, step_data):
-        """Create individual step widget with modern design"""
-        step_frame = QFrame()
-        step_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2d2d2d;
-                border: 1px solid #404040;
-                border-radius: 10px;
-                padding: 20px;
-                margin: 3px 0;
-            }
-            QFrame:hover {
-                background-color: #323232;
-                border: 1px solid #69923e;
-            }
-        """)
-        
-        step_layout = QHBoxLayout(step_frame)
-        step_layout.setSpacing(20)
-        
+    def add_step_row(self, grid, row, step):
+        """Add one installation step to the steps grid, using two rows"""
         # Step number circle with gradient
-        number_label = QLabel(step_data["number"])
-        number_label.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        number_label.setStyleSheet("""
-            QLabel {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #69923e,
-                    stop:1 #4e7837
-                );
-                color: white;
-                border-radius: 25px;
-                min-width: 50px;
-                max-width: 50px;
-                min-height: 50px;
-                max-height: 50px;
-            }
-        """)
-        number_label.setAlignment(Qt.AlignCenter)
-        step_layout.addWidget(number_label)
-        
-        # Step content
-        content_layout = QVBoxLayout()
-        content_layout.setSpacing(8)
-        
-        # Title with icon placeholder
-        title_label = QLabel(step_data["title"])
-        title_label.setFont(QFont("Segoe UI", 13, QFont.Bold))
+        number_label = QLabel()
+        number_label.setPixmap(_number_badge(
+            step.number, 50, 16, "#69923e", "#4e7837", self.devicePixelRatioF()
+        ))
+        number_label.setFixedSize(50, 50)
+        grid.addWidget(number_label, row, 0, 2, 1, Qt.AlignTop)
+        
+        # Title
+        title_label = QLabel(step.title)
+        title_label.setFont(_font(13, True))
         title_label.setStyleSheet("color: #ffffff; background: transparent;")
-        content_layout.addWidget(title_label)
+        grid.addWidget(title_label, row, 1)
         
         # Description
-        desc_label = QLabel(step_data["description"])
-        desc_label.setFont(QFont("Segoe UI", 10))
-        desc_label.setStyleSheet("color: #b0b0b0; background: transparent; line-height: 1.5;")
+        desc_label = QLabel(step.description)
+        desc_label.setFont(_font(10))
+        desc_label.setStyleSheet("color: #b0b0b0; background: transparent; line-height: 1.5; margin-bottom: 12px;")
         desc_label.setWordWrap(True)
-        content_layout.addWidget(desc_label)
-        
-        step_layout.addLayout(content_layout, 1)
+        grid.addWidget(desc_label, row + 1, 1)
         
         # Action button if provided
-        if step_data["button_text"] and step_data["action"]:
-            button = QPushButton(step_data["button_text"])
-            button.setFont(QFont("Segoe UI", 10, QFont.Bold))
-            button.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #69923e,
-                        stop:1 #4e7837
-                    );
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 12px 24px;
-                    min-height: 20px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #7aa84a,
-                        stop:1 #69923e
-                    );
-                }
-                QPushButton:pressed {
-                    background-color: #3e5f2b;
-                }
-            """)
-            button.clicked.connect(step_data["action"])
-            step_layout.addWidget(button)
-        
-        return step_frame
+        if step.button_text and step.action_name:
+            button = QPushButton(step.button_text)
+            button.setFont(_font(10, True))
+            button.setObjectName("step_button")
+            button.clicked.connect(getattr(self, step.action_name))
+            grid.addWidget(button, row, 2, 2, 1, Qt.AlignVCenter)
     
     def create_usage_section(self, layout):
         """Create usage information section"""
-        usage_frame = QFrame()
-        usage_frame.setStyleSheet("""
-            QFrame {
-                background-color: #252525;
-                border: 1px solid #3a3a3a;
-                border-radius: 12px;
-                padding: 30px;
-            }
-        """)
-        
-        usage_layout = QVBoxLayout(usage_frame)
-        usage_layout.setSpacing(18)
+        usage_frame, usage_layout = _card(layout, "section_frame", spacing=18)
         
         # Section title
         usage_title = QLabel("Quick Start Guide")
-        usage_title.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        usage_title.setFont(_font(18, True))
         usage_title.setStyleSheet("color: #69923e; background: transparent; margin-bottom: 5px;")
         usage_layout.addWidget(usage_title)
         
         # Subtitle
         usage_subtitle = QLabel("How to use BetterMint Modded after installation")
-        usage_subtitle.setFont(QFont("Segoe UI", 10))
+        usage_subtitle.setFont(_font(10))
         usage_subtitle.setStyleSheet("color: #b0b0b0; background: transparent; margin-bottom: 10px;")
         usage_layout.addWidget(usage_subtitle)
         
@@ -342,67 +373,26 @@ class ExtensionGuideWidget(QWidget):
             "Use visual hints, move suggestions, and evaluations to improve your play"
         ]
         
-        for i, item in enumerate(usage_items, 1):
-            item_frame = QFrame()
-            item_frame.setStyleSheet("""
-                QFrame {
-                    background-color: #2d2d2d;
-                    border-left: 3px solid #69923e;
-                    border-radius: 4px;
-                    padding: 12px 15px;
-                }
-            """)
-            
-            item_layout = QHBoxLayout(item_frame)
-            item_layout.setSpacing(12)
-            
-            # Number badge
-            number = QLabel(str(i))
-            number.setFont(QFont("Segoe UI", 10, QFont.Bold))
-            number.setStyleSheet("""
-                QLabel {
-                    background-color: #69923e;
-                    color: white;
-                    border-radius: 12px;
-                    min-width: 24px;
-                    max-width: 24px;
-                    min-height: 24px;
-                    max-height: 24px;
-                }
-            """)
-            number.setAlignment(Qt.AlignCenter)
-            item_layout.addWidget(number)
-            
-            # Item text
-            text = QLabel(item)
-            text.setFont(QFont("Segoe UI", 10))
-            text.setStyleSheet("color: #e0e0e0; background: transparent;")
-            text.setWordWrap(True)
-            item_layout.addWidget(text, 1)
-            
-            usage_layout.addWidget(item_frame)
-        
-        layout.addWidget(usage_frame)
+        # One rich-text label instead of a frame and two labels per item
+        rows = "".join(
+            _USAGE_ROW.format(number=i, text=html.escape(item))
+            for i, item in enumerate(usage_items, 1)
+        )
+        usage_list = QLabel()
+        usage_list.setTextFormat(Qt.RichText)
+        usage_list.setWordWrap(True)
+        usage_list.setFont(_font(10))
+        usage_list.setStyleSheet("background: transparent;")
+        usage_list.setText(f"<table cellspacing='8'>{rows}</table>")
+        usage_layout.addWidget(usage_list)
     
     def create_footer_section(self, layout):
         """Create footer section"""
-        footer_frame = QFrame()
-        footer_frame.setStyleSheet("""
-            QFrame {
-                background-color: #1f1f1f;
-                border: 1px solid #3a3a3a;
-                border-radius: 12px;
-                padding: 25px;
-                margin-top: 10px;
-            }
-        """)
-        
-        footer_layout = QVBoxLayout(footer_frame)
-        footer_layout.setSpacing(15)
+        footer_frame, footer_layout = _card(layout, "footer_frame", spacing=15)
         
         # Important notice
         notice_title = QLabel("Important Notice")
-        notice_title.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        notice_title.setFont(_font(12, True))
         notice_title.setStyleSheet("color: #ffa726; background: transparent;")
         notice_title.setAlignment(Qt.AlignCenter)
         footer_layout.addWidget(notice_title)
@@ -412,7 +402,7 @@ class ExtensionGuideWidget(QWidget):
             "Please use responsibly and in accordance with the terms of service of your chess platform. "
             "BetterMint Modded is intended to help you learn and improve your chess skills."
         )
-        note.setFont(QFont("Segoe UI", 9))
+        note.setFont(_font(9))
         note.setStyleSheet("color: #c0c0c0; background: transparent; line-height: 1.4;")
         note.setWordWrap(True)
         note.setAlignment(Qt.AlignCenter)
@@ -426,33 +416,25 @@ class ExtensionGuideWidget(QWidget):
         
         # Version info
         version_info = QLabel("MINT Beta 2c 26092025 Features - Educational Chess Analysis Tool")
-        version_info.setFont(QFont("Segoe UI", 9, QFont.Bold))
+        version_info.setFont(_font(9, True))
         version_info.setStyleSheet("color: #69923e; background: transparent;")
         version_info.setAlignment(Qt.AlignCenter)
         footer_layout.addWidget(version_info)
-        
-        layout.addWidget(footer_frame)
     
+    @Slot()
     def open_extension_folder(self):
         """Open the extension folder in file manager"""
         try:
-            # Get the extension folder path
-            script_dir = Path(__file__).parent.parent.parent
-            extension_dir = script_dir / "BetterMint ModdedModded"
+            extension_dir = _EXTENSION_DIR
             
-            if extension_dir.exists():
-                # Open folder based on OS
-                if sys.platform == 'win32':
-                    os.startfile(str(extension_dir))
-                elif sys.platform == 'darwin':  # macOS
-                    subprocess.run(['open', str(extension_dir)])
-                else:  # Linux
-                    subprocess.run(['xdg-open', str(extension_dir)])
+            if extension_dir.is_dir():
+                # Hands off to the platform file manager without waiting for it
+                if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(extension_dir))):
+                    raise OSError("No application is registered to open folders")
                 
                 print(f"Opened extension folder: {extension_dir}")
             else:
                 print(f"Extension folder not found: {extension_dir}")
-                from PySide6.QtWidgets import QMessageBox
                 QMessageBox.warning(
                     self,
                     "Folder Not Found", 
@@ -461,7 +443,6 @@ class ExtensionGuideWidget(QWidget):
                 )
         except Exception as e:
             print(f"Error opening extension folder: {e}")
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(
                 self,
                 "Error",
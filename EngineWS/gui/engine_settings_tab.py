@@ -8,20 +8,29 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QCheckBox, QGroupBox, 
     QGridLayout, QSpinBox, QLineEdit
 )
+from PySide6.QtCore import Slot
 
 from settings import SettingsManager
+from .settings_helpers import DebouncedSettingsMixin, signals_blocked
 
 
-class EngineSettingsTab(QWidget):
+class EngineSettingsTab(DebouncedSettingsMixin, QWidget):
     """Tab for engine configuration settings"""
     
     def __init__(self, settings_manager: SettingsManager, parent=None):
         super().__init__(parent)
         self.settings_manager = settings_manager
+
+        # URL typing and spin box edits are coalesced into one write per burst
+        self._init_debounce("engine")
+
         self.setup_ui()
     
     def setup_ui(self):
         """Setup the Engine Settings tab UI"""
+        # Maps each spin box to the setting key it edits
+        self._spin_bindings = {}
+
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
 
@@ -34,13 +43,13 @@ class EngineSettingsTab(QWidget):
         server_layout.addWidget(QLabel("WebSocket URL:"), 0, 0)
         self.api_url_edit = QLineEdit()
         self.api_url_edit.setText(self.settings_manager.get_setting("url-api-stockfish"))
-        self.api_url_edit.textChanged.connect(lambda x: self.settings_manager.set_setting("url-api-stockfish", x))
+        self.api_url_edit.textChanged.connect(self._on_api_url_changed)
         server_layout.addWidget(self.api_url_edit, 0, 1)
 
         # Use API
         self.api_checkbox = QCheckBox("Use WebSocket API")
         self.api_checkbox.setChecked(self.settings_manager.get_setting("api-stockfish"))
-        self.api_checkbox.toggled.connect(lambda x: self.settings_manager.set_setting("api-stockfish", x))
+        self.api_checkbox.toggled.connect(self._on_api_toggled)
         server_layout.addWidget(self.api_checkbox, 1, 0, 1, 2)
 
         layout.addWidget(server_group)
@@ -55,7 +64,8 @@ class EngineSettingsTab(QWidget):
         self.depth_spin = QSpinBox()
         self.depth_spin.setRange(1, 50)
         self.depth_spin.setValue(self.settings_manager.get_setting("depth"))
-        self.depth_spin.valueChanged.connect(lambda x: self.settings_manager.set_setting("depth", x))
+        self._spin_bindings[self.depth_spin] = "depth"
+        self.depth_spin.valueChanged.connect(self._on_spin_changed)
         engine_layout.addWidget(self.depth_spin, 0, 1)
 
         # MultiPV
@@ -63,7 +73,8 @@ class EngineSettingsTab(QWidget):
         self.multipv_spin = QSpinBox()
         self.multipv_spin.setRange(1, 10)
         self.multipv_spin.setValue(self.settings_manager.get_setting("multipv"))
-        self.multipv_spin.valueChanged.connect(lambda x: self.settings_manager.set_setting("multipv", x))
+        self._spin_bindings[self.multipv_spin] = "multipv"
+        self.multipv_spin.valueChanged.connect(self._on_spin_changed)
         engine_layout.addWidget(self.multipv_spin, 1, 1)
 
         # Mate finder
@@ -71,7 +82,8 @@ class EngineSettingsTab(QWidget):
         self.mate_finder_spin = QSpinBox()
         self.mate_finder_spin.setRange(1, 20)
         self.mate_finder_spin.setValue(self.settings_manager.get_setting("mate-finder-value"))
-        self.mate_finder_spin.valueChanged.connect(lambda x: self.settings_manager.set_setting("mate-finder-value", x))
+        self._spin_bindings[self.mate_finder_spin] = "mate-finder-value"
+        self.mate_finder_spin.valueChanged.connect(self._on_spin_changed)
         engine_layout.addWidget(self.mate_finder_spin, 2, 1)
 
         layout.addWidget(engine_group)
@@ -84,7 +96,7 @@ class EngineSettingsTab(QWidget):
         # Show threat arrows
         self.threat_arrows_checkbox = QCheckBox("Show Threat Arrows")
         self.threat_arrows_checkbox.setChecked(self.settings_manager.get_setting("show-threat-arrows"))
-        self.threat_arrows_checkbox.toggled.connect(lambda x: self.settings_manager.set_setting("show-threat-arrows", x))
+        self.threat_arrows_checkbox.toggled.connect(self._on_threat_arrows_toggled)
         self.threat_arrows_checkbox.setToolTip("Show green arrows for your threats and red arrows for opponent threats")
         threat_layout.addWidget(self.threat_arrows_checkbox, 0, 0, 1, 2)
 
@@ -93,7 +105,8 @@ class EngineSettingsTab(QWidget):
         self.max_player_threats_spin = QSpinBox()
         self.max_player_threats_spin.setRange(1, 15)
         self.max_player_threats_spin.setValue(self.settings_manager.get_setting("max-player-threats"))
-        self.max_player_threats_spin.valueChanged.connect(lambda x: self.settings_manager.set_setting("max-player-threats", x))
+        self._spin_bindings[self.max_player_threats_spin] = "max-player-threats"
+        self.max_player_threats_spin.valueChanged.connect(self._on_spin_changed)
         self.max_player_threats_spin.setToolTip("Maximum number of green threat arrows to show")
         threat_layout.addWidget(self.max_player_threats_spin, 1, 1)
 
@@ -102,23 +115,70 @@ class EngineSettingsTab(QWidget):
         self.max_opponent_threats_spin = QSpinBox()
         self.max_opponent_threats_spin.setRange(1, 15)
         self.max_opponent_threats_spin.setValue(self.settings_manager.get_setting("max-opponent-threats"))
-        self.max_opponent_threats_spin.valueChanged.connect(lambda x: self.settings_manager.set_setting("max-opponent-threats", x))
+        self._spin_bindings[self.max_opponent_threats_spin] = "max-opponent-threats"
+        self.max_opponent_threats_spin.valueChanged.connect(self._on_spin_changed)
         self.max_opponent_threats_spin.setToolTip("Maximum number of red threat arrows to show")
         threat_layout.addWidget(self.max_opponent_threats_spin, 2, 1)
 
         layout.addWidget(threat_group)
         layout.addStretch()
     
+    @Slot(str)
+    def _on_api_url_changed(self, text):
+        """Queue the WebSocket URL for the debounced write"""
+        self._queue("url-api-stockfish", text)
+
+    @Slot(bool)
+    def _on_api_toggled(self, checked):
+        """Persist the WebSocket API toggle"""
+        self._set_if_changed("api-stockfish", checked)
+
+    @Slot(bool)
+    def _on_threat_arrows_toggled(self, checked):
+        """Persist the threat arrows toggle"""
+        self._set_if_changed("show-threat-arrows", checked)
+
+    def _set_if_changed(self, key, value):
+        """Write a setting only when it differs from the stored value"""
+        if self.settings_manager.get_setting(key) != value:
+            self.settings_manager.set_setting(key, value)
+
+    def _queue(self, key, value):
+        """Queue a value for the debounced write unless it is already stored"""
+        if self.settings_manager.get_setting(key) == value:
+            # An edit that was undone inside the debounce window cancels out
+            self._pending.pop(key, None)
+        else:
+            super()._queue(key, value)
+
     def load_settings(self):
         """Reload settings from settings manager"""
         try:
-            self.api_url_edit.setText(self.settings_manager.get_setting("url-api-stockfish"))
-            self.api_checkbox.setChecked(self.settings_manager.get_setting("api-stockfish"))
-            self.depth_spin.setValue(self.settings_manager.get_setting("depth"))
-            self.multipv_spin.setValue(self.settings_manager.get_setting("multipv"))
-            self.mate_finder_spin.setValue(self.settings_manager.get_setting("mate-finder-value"))
-            self.threat_arrows_checkbox.setChecked(self.settings_manager.get_setting("show-threat-arrows"))
-            self.max_player_threats_spin.setValue(self.settings_manager.get_setting("max-player-threats"))
-            self.max_opponent_threats_spin.setValue(self.settings_manager.get_setting("max-opponent-threats"))
+            vals = self.settings_manager.get_many([
+                "url-api-stockfish",
+                "api-stockfish",
+                "depth",
+                "multipv",
+                "mate-finder-value",
+                "show-threat-arrows",
+                "max-player-threats",
+                "max-opponent-threats",
+            ])
+
+            self.discard_pending()
+
+            with signals_blocked(
+                self.api_url_edit, self.api_checkbox, self.depth_spin, self.multipv_spin,
+                self.mate_finder_spin, self.threat_arrows_checkbox,
+                self.max_player_threats_spin, self.max_opponent_threats_spin
+            ):
+                self.api_url_edit.setText(vals["url-api-stockfish"])
+                self.api_checkbox.setChecked(vals["api-stockfish"])
+                self.depth_spin.setValue(vals["depth"])
+                self.multipv_spin.setValue(vals["multipv"])
+                self.mate_finder_spin.setValue(vals["mate-finder-value"])
+                self.threat_arrows_checkbox.setChecked(vals["show-threat-arrows"])
+                self.max_player_threats_spin.setValue(vals["max-player-threats"])
+                self.max_opponent_threats_spin.setValue(vals["max-opponent-threats"])
         except Exception as e:
             print(f"Error loading engine settings: {e}")
\ No newline at end of file
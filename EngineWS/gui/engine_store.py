@@ -4,14 +4,18 @@ Allows importing, managing, and installing custom UCI chess engines
 """
 
 import os
+import re
 import json
+import sys
 import shutil
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QTextEdit, QMessageBox,
+    QListWidget, QTextEdit, QMessageBox,
     QFrame, QWidget, QScrollArea, QFileDialog, QLineEdit,
     QWizard, QWizardPage, QRadioButton, QButtonGroup
 )
@@ -20,13 +24,84 @@ from PySide6.QtGui import QFont, QIcon, QPixmap
 
 from constants import COLORS, APP_NAME
 
+store_logger = logging.getLogger('bettermint.engine_store')
+
+
+# Engines shipped with the app, listed when their executable is present
+_BUILTIN_ENGINES = (
+    {
+        'name': 'Stockfish',
+        'executable': 'stockfish/stockfish.exe',
+        'description': 'World\'s strongest chess engine with advanced analysis capabilities',
+        'platform': 'windows'
+    },
+    {
+        'name': 'Leela Chess Zero',
+        'executable': 'leela/lc0.exe',
+        'description': 'Neural network-based engine with human-like play and Maia support',
+        'platform': 'windows'
+    },
+    {
+        'name': 'Rodent IV',
+        'executable': 'rodent/rodent-iv-plain.exe',
+        'description': 'Personality-based engine with multiple playing styles',
+        'platform': 'windows'
+    },
+)
+
+# Runs of anything but word characters collapse to "_" in engine folder names
+_SLUG_RE = re.compile(r'[^\w]+')
+
+# Extensionless files above this are network weights or tablebases, not engines
+_MAX_EXECUTABLE_SIZE = 200 * 1024 * 1024
+
+# Buffer for Python-level copies when no in-kernel copy applies
+_COPY_BUFSIZE = 1024 * 1024
+
+# shutil.copyfile already has a fast path here: sendfile on Linux, fcopyfile
+# on macOS and a 1 MiB buffer on Windows; elsewhere it reads 64 KiB at a time
+_COPYFILE_IS_FAST = sys.platform.startswith(("linux", "darwin", "win"))
+
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    """Copy in the kernel with copy_file_range; False if the caller must copy instead"""
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            copied = 0
+            # Reflinks on copy-on-write filesystems, no user-space buffer otherwise
+            while True:
+                sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+                if not sent:
+                    break
+                copied += sent
+            # Some filesystems report 0 straight away for files that aren't empty
+            return copied > 0 or os.fstat(fsrc.fileno()).st_size == 0
+    except OSError:
+        # Unsupported by the kernel or across filesystems
+        return False
+
+
+def _copy_file(src: str, dst: str):
+    """Copy file contents, preferring an in-kernel copy over Python reads"""
+    if hasattr(os, "copy_file_range") and _copy_file_range(src, dst):
+        return
+
+    if _COPYFILE_IS_FAST:
+        shutil.copyfile(src, dst)
+    else:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+
 
 class EngineManifest:
     """Represents a chess engine with its metadata"""
     
     def __init__(self, name: str, executable: str, description: str = "",
-                 is_builtin: bool = False, platform: str = "windows"):
+                 is_builtin: bool = False, platform: str = "windows",
+                 slug: Optional[str] = None):
         self.name = name
+        # Folder name under engines_dir; persisted so the mapping never drifts
+        self.slug = slug or _SLUG_RE.sub('_', name.lower())
         self.executable = executable
         self.description = description
         self.is_builtin = is_builtin
@@ -40,17 +115,23 @@ class EngineManifest:
             'description': self.description,
             'is_builtin': self.is_builtin,
             'platform': self.platform,
-            'enabled': self.enabled
+            'enabled': self.enabled,
+            'slug': self.slug
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'EngineManifest':
+    def from_dict(cls, data: Dict, folder: Optional[str] = None) -> 'EngineManifest':
+        """Build a manifest; folder is the engine folder it was read from, if known"""
+        name = data.get('name', 'Unknown')
         manifest = cls(
-            name=data.get('name', 'Unknown'),
+            name=name,
             executable=data.get('executable', ''),
             description=data.get('description', ''),
             is_builtin=data.get('is_builtin', False),
-            platform=data.get('platform', 'windows')
+            platform=data.get('platform', 'windows'),
+            # The folder on disk is authoritative; manifests written before slugs
+            # were stored otherwise fall back to the old folder naming rule
+            slug=folder or data.get('slug') or name.lower().replace(' ', '_')
         )
         manifest.enabled = data.get('enabled', True)
         return manifest
@@ -63,69 +144,76 @@ class EngineManager:
         self.engines_dir = Path(engines_dir)
         self.engines_dir.mkdir(exist_ok=True)
         self.engines: Dict[str, EngineManifest] = {}
-        self.load_all_engines()
+        # manifest path -> (st_mtime_ns, parsed manifest), reused while unchanged
+        self._manifest_cache: Dict[str, tuple] = {}
+        # engine name -> resolved executable path
+        self._path_cache: Dict[str, str] = {}
+        # Built-in engines found on disk; rescanned only on request
+        self._builtin_engines: List[EngineManifest] = []
+        self.load_all_engines(rescan_builtins=True)
     
-    def load_all_engines(self):
+    def load_all_engines(self, rescan_builtins: bool = False):
         """Load all engines from the engines directory"""
         self.engines.clear()
+        self._path_cache.clear()
         
         # Load built-in engines
-        self._load_builtin_engines()
+        if rescan_builtins:
+            self._builtin_engines = self._scan_builtin_engines()
+        for manifest in self._builtin_engines:
+            self.engines[manifest.name] = manifest
         
         # Load custom engines from manifests
-        for engine_dir in self.engines_dir.iterdir():
-            if engine_dir.is_dir():
-                manifest_path = engine_dir / "manifest.json"
-                if manifest_path.exists():
-                    try:
-                        with open(manifest_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            manifest = EngineManifest.from_dict(data)
-                            self.engines[manifest.name] = manifest
-                    except Exception as e:
-                        print(f"Error loading manifest from {engine_dir}: {e}")
-    
-    def _load_builtin_engines(self):
-        """Load built-in engine definitions"""
-        builtin_engines = [
-            {
-                'name': 'Stockfish',
-                'executable': 'stockfish/stockfish.exe',
-                'description': 'World\'s strongest chess engine with advanced analysis capabilities',
-                'platform': 'windows'
-            },
-            {
-                'name': 'Leela Chess Zero',
-                'executable': 'leela/lc0.exe',
-                'description': 'Neural network-based engine with human-like play and Maia support',
-                'platform': 'windows'
-            },
-            {
-                'name': 'Rodent IV',
-                'executable': 'rodent/rodent-iv-plain.exe',
-                'description': 'Personality-based engine with multiple playing styles',
-                'platform': 'windows'
-            }
+        previous, self._manifest_cache = self._manifest_cache, {}
+        failures = []
+        with os.scandir(self.engines_dir) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                manifest_path = os.path.join(entry.path, "manifest.json")
+                try:
+                    # A missing manifest just means the folder isn't an engine
+                    mtime = os.stat(manifest_path).st_mtime_ns
+                    cached = previous.get(manifest_path)
+                    if cached is not None and cached[0] == mtime:
+                        manifest = cached[1]
+                    else:
+                        with open(manifest_path, 'rb') as f:
+                            data = json.loads(f.read())
+                        manifest = EngineManifest.from_dict(data, folder=entry.name)
+                    self._manifest_cache[manifest_path] = (mtime, manifest)
+                    self.engines[manifest.name] = manifest
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    failures.append(f"{entry.path}: {e}")
+        
+        if failures:
+            store_logger.warning(f"Failed to load {len(failures)} engine manifest(s): {'; '.join(failures)}")
+    
+    def _scan_builtin_engines(self) -> List[EngineManifest]:
+        """Return manifests for the built-in engines whose executable is present"""
+        return [
+            EngineManifest(
+                name=engine_data['name'],
+                executable=engine_data['executable'],
+                description=engine_data['description'],
+                is_builtin=True,
+                platform=engine_data['platform']
+            )
+            for engine_data in _BUILTIN_ENGINES
+            if (self.engines_dir / engine_data['executable']).exists()
         ]
-        
-        for engine_data in builtin_engines:
-            engine_path = self.engines_dir / engine_data['executable']
-            if engine_path.exists():
-                manifest = EngineManifest(
-                    name=engine_data['name'],
-                    executable=engine_data['executable'],
-                    description=engine_data['description'],
-                    is_builtin=True,
-                    platform=engine_data['platform']
-                )
-                self.engines[manifest.name] = manifest
     
     def install_engine(self, source_folder: Path, executable_name: str,
                       engine_name: str, description: str) -> bool:
         """Install a custom engine"""
         try:
             # Create engine directory
-            engine_dir = self.engines_dir / engine_name.lower().replace(' ', '_')
+            # Reinstalling keeps the existing folder, which may predate the slug rule
+            existing = self.engines.get(engine_name)
+            slug = existing.slug if existing is not None else _SLUG_RE.sub('_', engine_name.lower())
+            engine_dir = self.engines_dir / slug
             engine_dir.mkdir(exist_ok=True)
             
             # Verify executable exists in source
@@ -133,54 +221,61 @@ class EngineManager:
             if not source_executable.exists():
                 raise FileNotFoundError(f"Executable not found: {source_executable}")
             
-            print(f"Copying all files from {source_folder} to {engine_dir}")
-            copied_count = 0
+            store_logger.info(f"Copying all files from {source_folder} to {engine_dir}")
+            futures = []
+            executables = []
+            # Main executable on Linux needs execute permission
+            chmod_name = None if executable_name.endswith('.exe') else executable_name
             
-            for item in source_folder.rglob('*'):
-                if item.is_file():
-                    # Calculate relative path
-                    relative_path = item.relative_to(source_folder)
-                    dest_path = engine_dir / relative_path
-                    
-                    # Create parent directories if needed
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Copy file
-                    shutil.copy2(item, dest_path)
-                    copied_count += 1
-                    
-                    # Set executable permissions for main executable on Linux
-                    if item.name == executable_name and not executable_name.endswith('.exe'):
-                        try:
-                            dest_path.chmod(0o755)
-                        except:
-                            pass
+            def queue_copy(src, dst):
+                futures.append(pool.submit(_copy_file, src, dst))
+                if os.path.basename(dst) == chmod_name:
+                    executables.append(dst)
+                return dst
             
-            print(f"Copied {copied_count} files/dependencies")
+            # copytree walks the source and creates each directory once; file
+            # contents are copied on the pool, where the GIL is released so
+            # small dependencies overlap with the large engine/network files
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+                # Dangling links are skipped, as the old is_file() walk did
+                shutil.copytree(
+                    source_folder, engine_dir, dirs_exist_ok=True,
+                    ignore_dangling_symlinks=True, copy_function=queue_copy
+                )
+                for future in futures:
+                    future.result()
+            copied_count = len(futures)
+            
+            for dest_path in executables:
+                try:
+                    os.chmod(dest_path, 0o755)
+                except:
+                    pass
             
             # Create manifest
             manifest = EngineManifest(
                 name=engine_name,
-                executable=f"{engine_dir.name}/{executable_name}",
+                executable=f"{slug}/{executable_name}",
                 description=description,
                 is_builtin=False,
-                platform='windows' if executable_name.endswith('.exe') else 'linux'
+                platform='windows' if executable_name.endswith('.exe') else 'linux',
+                slug=slug
             )
             
             manifest_path = engine_dir / "manifest.json"
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest.to_dict(), f, indent=2)
+            # Serialise in memory and write once; json.dump writes per token
+            manifest_path.write_bytes(json.dumps(manifest.to_dict(), indent=2).encode('utf-8'))
+            self._manifest_cache.pop(str(manifest_path), None)
             
             # Add to engines dict
             self.engines[engine_name] = manifest
+            self._path_cache.pop(engine_name, None)
             
-            print(f"Successfully installed engine: {engine_name} with {copied_count} files")
+            store_logger.info(f"Successfully installed engine: {engine_name} with {copied_count} files")
             return True
             
         except Exception as e:
-            print(f"Error installing engine: {e}")
-            import traceback
-            traceback.print_exc()
+            store_logger.exception(f"Error installing engine: {e}")
             return False
     
     def uninstall_engine(self, engine_name: str) -> bool:
@@ -194,27 +289,165 @@ class EngineManager:
         
         try:
             # Remove engine directory
-            engine_dir = self.engines_dir / engine_name.lower().replace(' ', '_')
+            engine_dir = self.engines_dir / manifest.slug
             if engine_dir.exists():
                 shutil.rmtree(engine_dir)
+            self._manifest_cache.pop(str(engine_dir / "manifest.json"), None)
             
             # Remove from dict
             del self.engines[engine_name]
+            self._path_cache.pop(engine_name, None)
             
-            print(f"Successfully uninstalled engine: {engine_name}")
+            store_logger.info(f"Successfully uninstalled engine: {engine_name}")
             return True
             
         except Exception as e:
-            print(f"Error uninstalling engine: {e}")
+            store_logger.error(f"Error uninstalling engine: {e}")
             return False
     
     def get_engine_path(self, engine_name: str) -> Optional[str]:
         """Get full path to engine executable"""
+        path = self._path_cache.get(engine_name)
+        if path is not None:
+            return path
+        
         if engine_name not in self.engines:
             return None
         
         manifest = self.engines[engine_name]
-        return str(self.engines_dir / manifest.executable)
+        path = os.path.normpath(os.path.join(self.engines_dir, manifest.executable))
+        self._path_cache[engine_name] = path
+        return path
+
+
+# One manager per engines directory, shared by the main window and the store
+_managers: Dict[str, EngineManager] = {}
+
+
+def get_engine_manager(engines_dir: str = "engines") -> EngineManager:
+    """Return the shared EngineManager for a directory, revalidating its manifests"""
+    manager = _managers.get(engines_dir)
+    if manager is None:
+        manager = _managers[engines_dir] = EngineManager(engines_dir)
+    else:
+        # Only manifests whose mtime changed are parsed again
+        manager.load_all_engines()
+    return manager
+
+
+# Wizard stylesheet, formatted once against COLORS
+_WIZARD_QSS = f"""
+QWizard {{
+    background-color: {COLORS['darker_gray']};
+}}
+QWizardPage {{
+    background-color: {COLORS['darker_gray']};
+    color: {COLORS['white']};
+}}
+QLabel {{
+    color: {COLORS['white']};
+    font-size: 13px;
+}}
+QLabel#input_label {{
+    font-weight: 600;
+    font-size: 14px;
+    margin-top: 10px;
+}}
+QLabel#path_label {{
+    background-color: {COLORS['dark_gray']};
+    border: 2px solid {COLORS['light_green']};
+    border-radius: 4px;
+    padding: 10px;
+    font-family: monospace;
+}}
+QLabel#selection_label {{
+    color: {COLORS['light_green']};
+    font-weight: 600;
+}}
+QLabel#warning_label {{
+    color: {COLORS['warning_yellow']};
+    background-color: rgba(243, 156, 18, 0.1);
+    border-left: 3px solid {COLORS['warning_yellow']};
+    padding: 8px;
+    border-radius: 4px;
+    font-size: 12px;
+}}
+QLabel#summary_label {{
+    font-weight: 700;
+    font-size: 15px;
+    color: {COLORS['light_green']};
+    margin-top: 15px;
+}}
+QFrame#selection_frame {{
+    background-color: rgba(75, 72, 71, 0.5);
+    border: 2px solid {COLORS['dark_gray']};
+    border-radius: 6px;
+    padding: 15px;
+}}
+QPushButton#browse_button {{
+    background-color: {COLORS['light_green']};
+    color: {COLORS['white']};
+    border: none;
+    border-radius: 4px;
+    padding: 10px 20px;
+    font-weight: 600;
+    font-size: 13px;
+}}
+QPushButton#browse_button:hover {{
+    background-color: {COLORS['dark_green']};
+}}
+QListWidget#file_list {{
+    background-color: {COLORS['dark_gray']};
+    border: 2px solid {COLORS['light_green']};
+    border-radius: 4px;
+    color: {COLORS['white']};
+    font-size: 13px;
+    padding: 5px;
+}}
+QListWidget#file_list::item {{
+    padding: 8px;
+    border-radius: 3px;
+}}
+QListWidget#file_list::item:selected {{
+    background-color: {COLORS['light_green']};
+}}
+QLineEdit#name_input {{
+    background-color: {COLORS['dark_gray']};
+    border: 2px solid {COLORS['light_green']};
+    border-radius: 4px;
+    padding: 10px;
+    color: {COLORS['white']};
+    font-size: 14px;
+    font-weight: 500;
+}}
+QTextEdit#description_input, QTextEdit#summary_display {{
+    background-color: {COLORS['dark_gray']};
+    border: 2px solid {COLORS['light_green']};
+    border-radius: 4px;
+    padding: 10px;
+    color: {COLORS['white']};
+    font-size: 13px;
+}}
+QTextEdit#summary_display {{
+    background-color: rgba(75, 72, 71, 0.5);
+}}
+"""
+
+
+class _LazyPage(QWizardPage):
+    """Wizard page whose widgets are built the first time it is entered"""
+    
+    def __init__(self, title: str, subtitle: str, build, parent=None):
+        super().__init__(parent)
+        self.setTitle(title)
+        self.setSubTitle(subtitle)
+        self._build = build
+    
+    def initializePage(self):
+        if self._build is not None:
+            build, self._build = self._build, None
+            build(self)
+        super().initializePage()
 
 
 class EngineImportWizard(QWizard):
@@ -232,6 +465,10 @@ class EngineImportWizard(QWizard):
         self.engine_name = ""
         self.engine_description = ""
         
+        # Page widgets are created when each page is first entered
+        self.executable_list = None
+        self.summary_text = None
+        
         # Add pages
         self.addPage(self.create_folder_page())
         self.addPage(self.create_executable_page())
@@ -242,10 +479,14 @@ class EngineImportWizard(QWizard):
     
     def create_folder_page(self) -> QWizardPage:
         """Step 1: Select engine folder"""
-        page = QWizardPage()
-        page.setTitle("Select Engine Folder")
-        page.setSubTitle("Choose the folder containing your chess engine")
-        
+        return _LazyPage(
+            "Select Engine Folder",
+            "Choose the folder containing your chess engine",
+            self._build_folder_page
+        )
+    
+    def _build_folder_page(self, page: QWizardPage):
+        """Create the folder page widgets"""
         layout = QVBoxLayout(page)
         layout.setSpacing(20)
         
@@ -286,15 +527,17 @@ class EngineImportWizard(QWizard):
         
         layout.addWidget(folder_frame)
         layout.addStretch()
-        
-        return page
     
     def create_executable_page(self) -> QWizardPage:
         """Step 2: Select engine executable"""
-        page = QWizardPage()
-        page.setTitle("Select Engine Executable")
-        page.setSubTitle("Choose the main executable file for the engine")
-        
+        return _LazyPage(
+            "Select Engine Executable",
+            "Choose the main executable file for the engine",
+            self._build_executable_page
+        )
+    
+    def _build_executable_page(self, page: QWizardPage):
+        """Create the executable page widgets"""
         layout = QVBoxLayout(page)
         layout.setSpacing(20)
         
@@ -313,6 +556,8 @@ class EngineImportWizard(QWizard):
         
         self.executable_list = QListWidget()
         self.executable_list.setObjectName("file_list")
+        # Every row is one line of text, so Qt can skip measuring each item
+        self.executable_list.setUniformItemSizes(True)
         self.executable_list.itemSelectionChanged.connect(self.on_executable_selected)
         layout.addWidget(self.executable_list)
         
@@ -320,14 +565,18 @@ class EngineImportWizard(QWizard):
         self.executable_label.setObjectName("selection_label")
         layout.addWidget(self.executable_label)
         
-        return page
+        self.populate_executable_list()
     
     def create_name_page(self) -> QWizardPage:
         """Step 3: Enter engine name"""
-        page = QWizardPage()
-        page.setTitle("Name Your Engine")
-        page.setSubTitle("Provide a friendly name for this engine")
-        
+        return _LazyPage(
+            "Name Your Engine",
+            "Provide a friendly name for this engine",
+            self._build_name_page
+        )
+    
+    def _build_name_page(self, page: QWizardPage):
+        """Create the name page widgets"""
         layout = QVBoxLayout(page)
         layout.setSpacing(20)
         
@@ -356,15 +605,17 @@ class EngineImportWizard(QWizard):
         layout.addWidget(self.name_validation)
         
         layout.addStretch()
-        
-        return page
     
     def create_description_page(self) -> QWizardPage:
         """Step 4: Enter engine description"""
-        page = QWizardPage()
-        page.setTitle("Describe Your Engine")
-        page.setSubTitle("Add a brief description (optional)")
-        
+        return _LazyPage(
+            "Describe Your Engine",
+            "Add a brief description (optional)",
+            self._build_description_page
+        )
+    
+    def _build_description_page(self, page: QWizardPage):
+        """Create the description page widgets"""
         layout = QVBoxLayout(page)
         layout.setSpacing(20)
         
@@ -402,7 +653,7 @@ class EngineImportWizard(QWizard):
         self.summary_text.setMaximumHeight(120)
         layout.addWidget(self.summary_text)
         
-        return page
+        self.update_summary()
     
     def select_folder(self):
         """Open folder selection dialog"""
@@ -420,18 +671,29 @@ class EngineImportWizard(QWizard):
     
     def populate_executable_list(self):
         """Populate list of potential executables"""
-        if not self.selected_folder:
+        if not self.selected_folder or self.executable_list is None:
             return
         
         self.executable_list.clear()
         
         # Look for executable files
-        for file in self.selected_folder.iterdir():
-            if file.is_file():
-                # Windows executables or files without extension (Linux)
-                if file.suffix.lower() == '.exe' or not file.suffix:
-                    item = QListWidgetItem(file.name)
-                    self.executable_list.addItem(item)
+        names = []
+        with os.scandir(self.selected_folder) as it:
+            for entry in it:
+                name = entry.name
+                if not entry.is_file():
+                    continue
+                # Windows executables
+                if name.lower().endswith('.exe'):
+                    names.append(name)
+                # Files without extension (Linux), unless too large to be an engine binary
+                elif '.' not in name.lstrip('.') and entry.stat().st_size < _MAX_EXECUTABLE_SIZE:
+                    names.append(name)
+        self.executable_list.setUpdatesEnabled(False)
+        try:
+            self.executable_list.addItems(names)
+        finally:
+            self.executable_list.setUpdatesEnabled(True)
     
     def on_executable_selected(self):
         """Handle executable selection"""
@@ -460,6 +722,9 @@ class EngineImportWizard(QWizard):
     
     def update_summary(self):
         """Update import summary"""
+        if self.summary_text is None:
+            return
+        
         summary = []
         summary.append(f"<b>Engine Name:</b> {self.engine_name or 'Not set'}")
         summary.append(f"<b>Executable:</b> {self.selected_executable or 'Not selected'}")
@@ -494,118 +759,56 @@ class EngineImportWizard(QWizard):
     
     def apply_styles(self):
         """Apply custom styles to wizard"""
-        self.setStyleSheet(f"""
-            QWizard {{
-                background-color: {COLORS['darker_gray']};
-            }}
-            
-            QWizardPage {{
-                background-color: {COLORS['darker_gray']};
-                color: {COLORS['white']};
-            }}
-            
-            QLabel {{
-                color: {COLORS['white']};
-                font-size: 13px;
-            }}
-            
-            QLabel#input_label {{
-                font-weight: 600;
-                font-size: 14px;
-                margin-top: 10px;
-            }}
-            
-            QLabel#path_label {{
-                background-color: {COLORS['dark_gray']};
-                border: 2px solid {COLORS['light_green']};
-                border-radius: 4px;
-                padding: 10px;
-                font-family: monospace;
-            }}
-            
-            QLabel#selection_label {{
-                color: {COLORS['light_green']};
-                font-weight: 600;
-            }}
-            
-            QLabel#warning_label {{
-                color: {COLORS['warning_yellow']};
-                background-color: rgba(243, 156, 18, 0.1);
-                border-left: 3px solid {COLORS['warning_yellow']};
-                padding: 8px;
-                border-radius: 4px;
-                font-size: 12px;
-            }}
-            
-            QLabel#summary_label {{
-                font-weight: 700;
-                font-size: 15px;
-                color: {COLORS['light_green']};
-                margin-top: 15px;
-            }}
-            
-            QFrame#selection_frame {{
-                background-color: rgba(75, 72, 71, 0.5);
-                border: 2px solid {COLORS['dark_gray']};
-                border-radius: 6px;
-                padding: 15px;
-            }}
-            
-            QPushButton#browse_button {{
-                background-color: {COLORS['light_green']};
-                color: {COLORS['white']};
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-                font-weight: 600;
-                font-size: 13px;
-            }}
-            
-            QPushButton#browse_button:hover {{
-                background-color: {COLORS['dark_green']};
-            }}
-            
-            QListWidget#file_list {{
-                background-color: {COLORS['dark_gray']};
-                border: 2px solid {COLORS['light_green']};
-                border-radius: 4px;
-                color: {COLORS['white']};
-                font-size: 13px;
-                padding: 5px;
-            }}
-            
-            QListWidget#file_list::item {{
-                padding: 8px;
-                border-radius: 3px;
-            }}
-            
-            QListWidget#file_list::item:selected {{
-                background-color: {COLORS['light_green']};
-            }}
-            
-            QLineEdit#name_input {{
-                background-color: {COLORS['dark_gray']};
-                border: 2px solid {COLORS['light_green']};
-                border-radius: 4px;
-                padding: 10px;
-                color: {COLORS['white']};
-                font-size: 14px;
-                font-weight: 500;
-            }}
-            
-            QTextEdit#description_input, QTextEdit#summary_display {{
-                background-color: {COLORS['dark_gray']};
-                border: 2px solid {COLORS['light_green']};
-                border-radius: 4px;
-                padding: 10px;
-                color: {COLORS['white']};
-                font-size: 13px;
-            }}
-            
-            QTextEdit#summary_display {{
-                background-color: rgba(75, 72, 71, 0.5);
-            }}
-        """)
+        self.setStyleSheet(_WIZARD_QSS)
+
+
+# Engine card stylesheet, formatted once against COLORS and set on the card container
+_CARD_QSS = f"""
+QFrame#engine_card {{
+    background-color: rgba(75, 72, 71, 0.5);
+    border: 2px solid {COLORS['dark_gray']};
+    border-radius: 8px;
+}}
+QFrame#engine_card:hover {{
+    border-color: {COLORS['light_green']};
+}}
+QLabel#engine_name {{
+    color: {COLORS['light_green']};
+}}
+QLabel#builtin_badge {{
+    background-color: {COLORS['accent_blue']};
+    color: {COLORS['white']};
+    padding: 3px 8px;
+    border-radius: 3px;
+    font-size: 10px;
+    font-weight: 700;
+}}
+QLabel#engine_description {{
+    color: rgba(255, 255, 255, 0.85);
+    font-size: 12px;
+}}
+QLabel#engine_info {{
+    color: {COLORS['white']};
+    font-size: 11px;
+    font-weight: 600;
+}}
+QLabel#engine_path {{
+    color: rgba(255, 255, 255, 0.6);
+    font-size: 10px;
+    font-family: monospace;
+}}
+QPushButton#delete_button {{
+    background-color: {COLORS['error_red']};
+    color: {COLORS['white']};
+    border: none;
+    border-radius: 14px;
+    font-size: 20px;
+    font-weight: 700;
+}}
+QPushButton#delete_button:hover {{
+    background-color: #c0392b;
+}}
+"""
 
 
 class EngineCard(QFrame):
@@ -617,8 +820,8 @@ class EngineCard(QFrame):
     def __init__(self, manifest: EngineManifest, parent=None):
         super().__init__(parent)
         self.manifest = manifest
+        # Styled by _CARD_QSS on the store's scroll content
         self.setup_ui()
-        self.apply_styles()
     
     def setup_ui(self):
         """Setup card UI"""
@@ -677,63 +880,70 @@ class EngineCard(QFrame):
         bottom_layout.addWidget(path_label)
         
         layout.addLayout(bottom_layout)
-    
-    def apply_styles(self):
-        """Apply custom styles"""
-        self.setStyleSheet(f"""
-            QFrame#engine_card {{
-                background-color: rgba(75, 72, 71, 0.5);
-                border: 2px solid {COLORS['dark_gray']};
-                border-radius: 8px;
-            }}
-            
-            QFrame#engine_card:hover {{
-                border-color: {COLORS['light_green']};
-            }}
-            
-            QLabel#engine_name {{
-                color: {COLORS['light_green']};
-            }}
-            
-            QLabel#builtin_badge {{
-                background-color: {COLORS['accent_blue']};
-                color: {COLORS['white']};
-                padding: 3px 8px;
-                border-radius: 3px;
-                font-size: 10px;
-                font-weight: 700;
-            }}
-            
-            QLabel#engine_description {{
-                color: rgba(255, 255, 255, 0.85);
-                font-size: 12px;
-            }}
-            
-            QLabel#engine_info {{
-                color: {COLORS['white']};
-                font-size: 11px;
-                font-weight: 600;
-            }}
-            
-            QLabel#engine_path {{
-                color: rgba(255, 255, 255, 0.6);
-                font-size: 10px;
-                font-family: monospace;
-            }}
-            
-            QPushButton#delete_button {{
-                background-color: {COLORS['error_red']};
-                color: {COLORS['white']};
-                border: none;
-                border-radius: 14px;
-                font-size: 20px;
-                font-weight: 700;
-            }}
-            
-            QPushButton#delete_button:hover {{
-                background-color: #c0392b;
-            }}
-        """)
+
+
+# Store dialog stylesheet, formatted once against COLORS
+_STORE_QSS = f"""
+QDialog {{
+    background-color: {COLORS['darker_gray']};
+    color: {COLORS['white']};
+}}
+QLabel#store_title {{
+    color: {COLORS['light_green']};
+}}
+QLabel#store_subtitle {{
+    color: rgba(255, 255, 255, 0.8);
+    font-size: 13px;
+}}
+QLabel#no_engines_label {{
+    color: rgba(255, 255, 255, 0.6);
+    font-size: 14px;
+    padding: 40px;
+}}
+QPushButton#import_button {{
+    background-color: {COLORS['light_green']};
+    color: {COLORS['white']};
+    border: none;
+    border-radius: 6px;
+    padding: 10px 20px;
+    font-weight: 700;
+    font-size: 14px;
+}}
+QPushButton#import_button:hover {{
+    background-color: {COLORS['dark_green']};
+}}
+QPushButton#action_button {{
+    background-color: {COLORS['dark_gray']};
+    color: {COLORS['white']};
+    border: 2px solid {COLORS['light_green']};
+    border-radius: 4px;
+    padding: 8px 16px;
+    font-weight: 600;
+}}
+QPushButton#action_button:hover {{
+    background-color: {COLORS['light_green']};
+}}
+QScrollArea#engines_scroll {{
+    border: none;
+    background-color: transparent;
+}}
+QWidget#scroll_content {{
+    background-color: transparent;
+}}
+QScrollBar:vertical {{
+    background-color: {COLORS['dark_gray']};
+    width: 12px;
+    border-radius: 6px;
+}}
+QScrollBar::handle:vertical {{
+    background-color: {COLORS['light_green']};
+    border-radius: 6px;
+    min-height: 20px;
+}}
+QScrollBar::handle:vertical:hover {{
+    background-color: {COLORS['dark_green']};
+}}
+"""
 
 
 class EngineStoreDialog(QDialog):
@@ -747,7 +957,9 @@ class EngineStoreDialog(QDialog):
         self.setMinimumSize(800, 600)
         self.resize(900, 700)
         
-        self.engine_manager = EngineManager()
+        self.engine_manager = get_engine_manager()
+        # engine name -> card currently shown for it
+        self._card_by_name: Dict[str, EngineCard] = {}
         
         self.setup_ui()
         self.apply_styles()
@@ -792,13 +1004,15 @@ class EngineStoreDialog(QDialog):
         scroll.setWidgetResizable(True)
         scroll.setObjectName("engines_scroll")
         
-        scroll_content = QWidget()
-        scroll_content.setObjectName("scroll_content")
-        self.engines_layout = QVBoxLayout(scroll_content)
+        self.scroll_content = QWidget()
+        self.scroll_content.setObjectName("scroll_content")
+        # One stylesheet for every card instead of one per card
+        self.scroll_content.setStyleSheet(_CARD_QSS)
+        self.engines_layout = QVBoxLayout(self.scroll_content)
         self.engines_layout.setSpacing(10)
         self.engines_layout.addStretch()
         
-        scroll.setWidget(scroll_content)
+        scroll.setWidget(self.scroll_content)
         layout.addWidget(scroll)
         
         # Bottom buttons
@@ -807,7 +1021,7 @@ class EngineStoreDialog(QDialog):
         
         refresh_btn = QPushButton("Refresh")
         refresh_btn.setObjectName("action_button")
-        refresh_btn.clicked.connect(self.load_engines)
+        refresh_btn.clicked.connect(self.refresh_engines)
         buttons_layout.addWidget(refresh_btn)
         
         close_btn = QPushButton("Close")
@@ -819,16 +1033,38 @@ class EngineStoreDialog(QDialog):
     
     def load_engines(self):
         """Load and display all engines"""
-        # Clear existing cards
+        # Swap all cards before the container lays out and repaints again
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            self._rebuild_engine_cards()
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
+    
+    def _rebuild_engine_cards(self):
+        """Sync the engine cards with the loaded engines, reusing unchanged ones"""
+        engines = self.engine_manager.engines
+        
+        # The manager hands back the same manifest object while it is unchanged on disk
+        kept = {
+            name: card for name, card in self._card_by_name.items()
+            if engines.get(name) is card.manifest
+        }
+        kept_ids = {id(card) for card in kept.values()}
+        
+        # Detach everything; only stale cards and the empty-state label are deleted
         while self.engines_layout.count() > 1:  # Keep stretch
-            item = self.engines_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add engine cards
-        for manifest in self.engine_manager.engines.values():
-            card = EngineCard(manifest)
-            card.delete_requested.connect(self.delete_engine)
+            widget = self.engines_layout.takeAt(0).widget()
+            if widget is not None and id(widget) not in kept_ids:
+                widget.deleteLater()
+        
+        # Re-add engine cards in manager order, creating only the new ones
+        self._card_by_name = {}
+        for name, manifest in engines.items():
+            card = kept.get(name)
+            if card is None:
+                card = EngineCard(manifest)
+                card.delete_requested.connect(self.delete_engine)
+            self._card_by_name[name] = card
             self.engines_layout.insertWidget(self.engines_layout.count() - 1, card)
         
         # Show message if no engines
@@ -838,6 +1074,11 @@ class EngineStoreDialog(QDialog):
             no_engines_label.setAlignment(Qt.AlignCenter)
             self.engines_layout.insertWidget(0, no_engines_label)
     
+    def refresh_engines(self):
+        """Rescan the engines folder, including built-in engines, and redisplay"""
+        self.engine_manager.load_all_engines(rescan_builtins=True)
+        self.load_engines()
+    
     def import_engine(self):
         """Open import wizard"""
         wizard = EngineImportWizard(self)
@@ -886,76 +1127,4 @@ class EngineStoreDialog(QDialog):
     
     def apply_styles(self):
         """Apply custom styles"""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLORS['darker_gray']};
-                color: {COLORS['white']};
-            }}
-            
-            QLabel#store_title {{
-                color: {COLORS['light_green']};
-            }}
-            
-            QLabel#store_subtitle {{
-                color: rgba(255, 255, 255, 0.8);
-                font-size: 13px;
-            }}
-            
-            QLabel#no_engines_label {{
-                color: rgba(255, 255, 255, 0.6);
-                font-size: 14px;
-                padding: 40px;
-            }}
-            
-            QPushButton#import_button {{
-                background-color: {COLORS['light_green']};
-                color: {COLORS['white']};
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-weight: 700;
-                font-size: 14px;
-            }}
-            
-            QPushButton#import_button:hover {{
-                background-color: {COLORS['dark_green']};
-            }}
-            
-            QPushButton#action_button {{
-                background-color: {COLORS['dark_gray']};
-                color: {COLORS['white']};
-                border: 2px solid {COLORS['light_green']};
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: 600;
-            }}
-            
-            QPushButton#action_button:hover {{
-                background-color: {COLORS['light_green']};
-            }}
-            
-            QScrollArea#engines_scroll {{
-                border: none;
-                background-color: transparent;
-            }}
-            
-            QWidget#scroll_content {{
-                background-color: transparent;
-            }}
-            
-            QScrollBar:vertical {{
-                background-color: {COLORS['dark_gray']};
-                width: 12px;
-                border-radius: 6px;
-            }}
-            
-            QScrollBar::handle:vertical {{
-                background-color: {COLORS['light_green']};
-                border-radius: 6px;
-                min-height: 20px;
-            }}
-            
-            QScrollBar::handle:vertical:hover {{
-                background-color: {COLORS['dark_green']};
-            }}
-        """)
\ No newline at end of file
+        self.setStyleSheet(_STORE_QSS)
\ No newline at end of file
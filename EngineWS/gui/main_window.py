@@ -27,7 +27,7 @@ from .tabs import (
     VisualSettingsTab, AdvancedSettingsTab, MonitoringTab, ChessComWebView
 )
 from .intelligence_tab import IntelligenceTab
-from .engine_store import EngineStoreDialog, EngineManager
+from .engine_store import EngineStoreDialog, get_engine_manager
 from settings import SettingsManager
 from server import create_server
 from engine import EngineChess, EnhancedIntelligentEngineManager
@@ -293,7 +293,7 @@ class ChessEngineGUI(QMainWindow):
         self.server_running = False
         
         # Engine manager for custom engines
-        self.engine_manager = EngineManager()
+        self.engine_manager = get_engine_manager()
         self.custom_engine_checkboxes = {}
 
         # Performance monitoring with smoothing
@@ -1611,7 +1611,8 @@ class ChessEngineGUI(QMainWindow):
 
     # Menu actions
     def new_profile(self):
-        self.settings_manager.settings = self.settings_manager.default_settings.copy()
+        # Resets intelligence settings too and saves, as the tabs no longer echo values back
+        self.settings_manager.reset_to_defaults()
         self.load_gui_settings()
         self.monitoring_tab.log_activity("New profile created")
 
@@ -1621,7 +1622,8 @@ class ChessEngineGUI(QMainWindow):
             try:
                 with open(file_path, 'r') as f:
                     profile_data = json.load(f)
-                self.settings_manager.settings.update(profile_data)
+                # Refreshes intelligence settings from the profile and saves it
+                self.settings_manager.update_settings(profile_data)
                 self.load_gui_settings()
                 self.monitoring_tab.log_activity(f"Profile loaded from {file_path}")
             except Exception as e:
@@ -1680,6 +1682,10 @@ class ChessEngineGUI(QMainWindow):
         self.intelligence_tab.load_settings()
 
     def closeEvent(self, event):
+        # Commit spin box edits still inside their debounce window
+        self.engine_settings_tab.flush_pending()
+        self.automove_settings_tab.flush_pending()
+
         if self.server_running:
             self.stop_server()
 
@@ -0,0 +1,73 @@
+"""
+Shared helpers for BetterMint Modded settings tabs
+Debounced setting writes and signal-blocked widget reloads
+"""
+
+from contextlib import contextmanager
+
+from PySide6.QtCore import QTimer, QSignalBlocker
+
+
+@contextmanager
+def signals_blocked(*widgets):
+    """Block widget signals so reloading does not write every value back"""
+    blockers = [QSignalBlocker(w) for w in widgets]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
+
+class DebouncedSettingsMixin:
+    """Coalesces bursts of edits into one settings write per key
+    
+    Mix in ahead of QWidget, call _init_debounce from __init__, and register
+    spin boxes in self._spin_bindings to route them through _on_spin_changed.
+    """
+    
+    DEBOUNCE_MS = 250
+    
+    def _init_debounce(self, description: str):
+        """Create the pending-value store and the debounce timer"""
+        self._pending = {}
+        self._debounce_description = description
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.DEBOUNCE_MS)
+        self._flush_timer.timeout.connect(self._flush)
+    
+    def hideEvent(self, event):
+        """Commit queued edits when the tab is hidden or the window closes"""
+        self.flush_pending()
+        super().hideEvent(event)
+    
+    def _on_spin_changed(self, value):
+        """Queue a spin box value for the debounced write"""
+        key = self._spin_bindings.get(self.sender())
+        if key is not None:
+            self._queue(key, value)
+    
+    def _queue(self, key, value):
+        """Store a pending value and restart the debounce timer"""
+        self._pending[key] = value
+        self._flush_timer.start()
+    
+    def _flush(self):
+        """Commit the last value queued for each key"""
+        pending, self._pending = self._pending, {}
+        for key, value in pending.items():
+            try:
+                self.settings_manager.set_setting(key, value)
+            except Exception as e:
+                print(f"Error saving {self._debounce_description} setting {key}: {e}")
+    
+    def flush_pending(self):
+        """Write queued edits now instead of waiting for the debounce"""
+        self._flush_timer.stop()
+        self._flush()
+    
+    def discard_pending(self):
+        """Drop queued edits; used when reloaded values take precedence"""
+        self._flush_timer.stop()
+        self._pending.clear()
@@ -285,6 +285,12 @@ setoption name BookFilter value 20"""
         """Get a specific setting value"""
         return self.settings.get(key, default)
 
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several setting values in one pass, falling back to the defaults"""
+        settings = self.settings
+        defaults = self.default_settings
+        return {key: settings.get(key, defaults.get(key)) for key in keys}
+
     def set_setting(self, key: str, value: Any):
         """Set a specific setting value"""
         self.settings[key] = value
@@ -457,11 +463,12 @@ setoption name BookFilter value 20"""
         selected_personality = self.get_selected_rodent_personality()
         return self.parse_personality_file(selected_personality)
 
-    def reset_to_defaults(self):
-        """Reset all settings to defaults"""
+    def reset_to_defaults(self) -> Dict[str, Any]:
+        """Reset all settings to defaults and return the new values"""
         self.settings = self.default_settings.copy()
         self.intelligence_settings = IntelligenceSettings()
         self.save_settings()
+        return self.get_all_settings()
 
     def export_settings(self, filepath: str) -> bool:
         """Export settings to a file"""